@@ -1,164 +1,227 @@
-import asyncio
-import threading
-import webbrowser
-import gradio as gr
-import logging
-
-logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
-
-async def async_canvas_ui(pm, chat_handler, context, plugins):
-    """
-    Main async UI builder for Code Canvas.
-    `plugins` expected as dict: {plugin_name: plugin_dict_with_ui_key}
-    """
-    with gr.Blocks(title="Code Canvas", analytics_enabled=False) as demo:
-        gr.Markdown("# 🧠 Code Canvas")
-
-        tab_names = [
-            "CodeRunnerTab",
-            "FeedbackTab",
-            "ProjectTreeViewerTab",
-            "CanvasPlugins",
-            "AssistantEmbedTab"
-        ]
-
-        tab_labels = {
-            "CodeRunnerTab": "Code Runner",
-            "FeedbackTab": "Feedback Loop",
-            "ProjectTreeViewerTab": "Project Tree Viewer",
-            "CanvasPlugins": "Canvas Plugins",
-            "AssistantEmbedTab": "Assistant UI Embedded",
-        }
-
-        with gr.Tabs():
-            for tab_key in tab_names:
-                with gr.Tab(tab_labels.get(tab_key, tab_key)):
-                    if tab_key == "CanvasPlugins":
-                        # Render all plugin UIs
-                        for name, plugin in plugins.items():
-                            try:
-                                ui_comp = plugin.get("ui")
-                                # Await coroutine or async callable UI components
-                                if asyncio.iscoroutine(ui_comp):
-                                    ui_comp = await ui_comp
-                                elif callable(ui_comp):
-                                    if asyncio.iscoroutinefunction(ui_comp):
-                                        ui_comp = await ui_comp()
-                                    else:
-                                        ui_comp = ui_comp()
-                                # Log type for debug
-                                logger.info(f"Plugin '{name}' UI type after await: {type(ui_comp)}")
-                                # UI component is expected to be a Gradio component or container
-                                # Just placing ui_comp here to include it in UI
-                                ui_comp
-                            except Exception as e:
-                                gr.Markdown(f"⚠️ Failed to load plugin `{name}`: {e}")
-
-                    elif tab_key == "AssistantEmbedTab":
-                        with gr.Column() as assistant_ui_container:
-                            gr.Markdown("Loading Assistant UI...")
-                        # Schedule async population of assistant UI tab
-                        asyncio.create_task(
-                            populate_assistant_ui(assistant_ui_container, pm, chat_handler, context)
-                        )
-                    else:
-                        # Render UI for individual plugin matching this tab key, if exists
-                        plugin = plugins.get(tab_key)
-                        if plugin:
-                            ui_comp = plugin.get("ui")
-                            if ui_comp:
-                                try:
-                                    if asyncio.iscoroutine(ui_comp):
-                                        ui_comp = await ui_comp
-                                    elif callable(ui_comp):
-                                        if asyncio.iscoroutinefunction(ui_comp):
-                                            ui_comp = await ui_comp()
-                                        else:
-                                            ui_comp = ui_comp()
-                                    logger.info(f"Plugin '{tab_key}' UI type after await: {type(ui_comp)}")
-                                    ui_comp
-                                except Exception as e:
-                                    gr.Markdown(f"⚠️ Plugin `{tab_key}` failed: {e}")
-
-    return demo
-
-
-async def populate_assistant_ui(container, pm, chat_handler, context):
-    """
-    Populate the Assistant UI tab asynchronously.
-    """
-    from assistant_controller.gradio_ui import create_combined_ui
-    assistant_ui = await create_combined_ui(pm, chat_handler, context)
-    container.clear()
-    # Insert assistant_ui directly, assumed to be a Gradio component/container
-    container.append(assistant_ui)
-
-
-def open_browser_later(url: str, delay: int = 3):
-    import time
-    time.sleep(delay)
-    webbrowser.open_new_tab(url)
-
-
-async def main_async():
-    from assistant_controller.project_manager import ProjectManager
-    from ai_memory.codecanvas.context_manager import ContextManager
-    from assistant_controller.chat_handler import ChatHandler
-    from .ui_script_loader import get_canvas_plugins_ui
-
-    pm = ProjectManager(profile="default")
-    context = ContextManager()
-    # Pass context to ChatHandler for better state coordination
-    chat_handler = ChatHandler(
-        context_manager=context,
-        get_project_path=pm.get_current_project
-    )
-
-    # Get plugin dict, must be dict not Gradio UI container
-    plugins = await get_canvas_plugins_ui(context)
-    if not isinstance(plugins, dict):
-        logger.warning(f"Expected plugins dict but got {type(plugins)}; attempting to continue")
-
-    demo = await async_canvas_ui(pm, chat_handler, context, plugins)
-    return demo
-
-
-def main():
-    import sys
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-
-    demo = asyncio.run(main_async())
-
-    url = "http://127.0.0.1:7861"
-    threading.Thread(target=open_browser_later, args=(url,), daemon=True).start()
-
-    demo.launch(
-        server_port=7861,
-        inbrowser=False,
-        prevent_thread_lock=True,
-        share=False,
-        quiet=False,
-    )
-
-
-if __name__ == "__main__":
-    main()
-
-
-# ─────────────────────────────────────────────
-# Exportable render() for external caller
-# ─────────────────────────────────────────────
-async def render(pm, chat_handler, context, plugins, *args, **kwargs):
-    return await async_canvas_ui(pm, chat_handler, context, plugins)
-
-
-if __name__ == "__main__":
-    main()
-
-# ÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄ
-# Exportable render() for external caller
-# ÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄÄ
-async def render(*args, **kwargs):
-    return await async_canvas_ui(*args, **kwargs)
+import asyncio
+import webbrowser
+import gradio as gr
+import logging
+
+from ai_memory.codecanvas.context_manager import ContextManager
+from ai_memory.codecanvas.ui_script_loader import get_canvas_plugins_ui
+from assistant_controller.project_manager import ProjectManager
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+# Fixed tab layout; module constants so UI builds don't reallocate them
+_TAB_ORDER = (
+    "CodeRunnerTab",
+    "FeedbackTab",
+    "ProjectTreeViewerTab",
+    "CanvasPlugins",
+    "AssistantEmbedTab",
+)
+
+_TAB_LABELS = {
+    "CodeRunnerTab": "Code Runner",
+    "FeedbackTab": "Feedback Loop",
+    "ProjectTreeViewerTab": "Project Tree Viewer",
+    "CanvasPlugins": "Canvas Plugins",
+    "AssistantEmbedTab": "Assistant UI Embedded",
+}
+
+# Strong references to background population tasks; bare create_task results
+# can be garbage-collected mid-flight and their exceptions swallowed
+_bg_tasks = set()
+
+def _on_bg_task_done(task):
+    _bg_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background UI task failed: %s", task.exception())
+
+def _track_task(coro):
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_on_bg_task_done)
+    return task
+
+# Shell (Blocks + header + tab strip with one Column slot per tab) built
+# once per process; async_canvas_ui only refills the slots on remount
+_shell_cache = None
+
+def _build_shell():
+    global _shell_cache
+    if _shell_cache is not None:
+        return _shell_cache
+
+    slots = {}
+    with gr.Blocks(title="Code Canvas", analytics_enabled=False) as demo:
+        gr.Markdown("# 🧠 Code Canvas")
+
+        with gr.Tabs():
+            for tab_key, label, _handler in _TAB_DISPATCH:
+                with gr.Tab(label):
+                    with gr.Column() as slot:
+                        gr.Markdown("Loading...")
+                    slots[tab_key] = slot
+
+    _shell_cache = (demo, slots)
+    return _shell_cache
+
+
+async def _resolve_ui_comp(ui_comp):
+    # Await coroutine or async callable UI components
+    if asyncio.iscoroutine(ui_comp):
+        ui_comp = await ui_comp
+    elif callable(ui_comp):
+        if asyncio.iscoroutinefunction(ui_comp):
+            ui_comp = await ui_comp()
+        else:
+            ui_comp = ui_comp()
+            if asyncio.iscoroutine(ui_comp):
+                ui_comp = await ui_comp
+    return ui_comp
+
+
+async def _render_canvas_plugins(slot, pm, chat_handler, context, plugins):
+    # Render all plugin UIs
+    for name, plugin in plugins.items():
+        try:
+            ui_comp = await _resolve_ui_comp(plugin.get("ui"))
+            # Log type for debug
+            logger.info("Plugin '%s' UI type after await: %s", name, type(ui_comp))
+            if ui_comp is not None:
+                slot.append(ui_comp)
+        except Exception as e:
+            logger.error("Failed to load plugin '%s': %s", name, e)
+
+
+async def _render_assistant_embed(slot, pm, chat_handler, context, plugins):
+    # Schedule async population of assistant UI tab
+    _track_task(populate_assistant_ui(slot, pm, chat_handler, context))
+
+
+def _make_plugin_tab_handler(tab_key):
+    # Render UI for the individual plugin matching this tab key, if it exists
+    async def _render(slot, pm, chat_handler, context, plugins):
+        plugin = plugins.get(tab_key)
+        if not plugin:
+            return
+        ui_comp = plugin.get("ui")
+        if not ui_comp:
+            return
+        try:
+            ui_comp = await _resolve_ui_comp(ui_comp)
+            logger.info("Plugin '%s' UI type after await: %s", tab_key, type(ui_comp))
+            if ui_comp is not None:
+                slot.append(ui_comp)
+        except Exception as e:
+            logger.error("Plugin '%s' failed: %s", tab_key, e)
+    return _render
+
+
+def _handler_for(tab_key):
+    if tab_key == "CanvasPlugins":
+        return _render_canvas_plugins
+    if tab_key == "AssistantEmbedTab":
+        return _render_assistant_embed
+    return _make_plugin_tab_handler(tab_key)
+
+
+# (key, label, handler) per tab, resolved once at import so the UI-build
+# loop is a straight-line dispatch table
+_TAB_DISPATCH = tuple(
+    (key, _TAB_LABELS.get(key, key), _handler_for(key)) for key in _TAB_ORDER
+)
+
+
+async def async_canvas_ui(pm, chat_handler, context, plugins):
+    """
+    Main async UI builder for Code Canvas.
+    `plugins` expected as dict: {plugin_name: plugin_dict_with_ui_key}
+    """
+    demo, slots = _build_shell()
+
+    for tab_key, _label, handler in _TAB_DISPATCH:
+        slot = slots[tab_key]
+        slot.clear()
+        await handler(slot, pm, chat_handler, context, plugins)
+
+    return demo
+
+
+# Imported lazily to avoid a circular import with assistant_controller.gradio_ui;
+# the sentinel means the import machinery runs once, not per call
+_create_combined_ui = None
+
+def _get_create_combined_ui():
+    global _create_combined_ui
+    if _create_combined_ui is None:
+        from assistant_controller.gradio_ui import create_combined_ui
+        _create_combined_ui = create_combined_ui
+    return _create_combined_ui
+
+
+async def populate_assistant_ui(container, pm, chat_handler, context):
+    """
+    Populate the Assistant UI tab asynchronously.
+    """
+    assistant_ui = await _get_create_combined_ui()(pm, chat_handler, context)
+    container.clear()
+    # Insert assistant_ui directly, assumed to be a Gradio component/container
+    container.append(assistant_ui)
+
+
+async def main_async():
+    # ChatHandler stays lazy: assistant_controller.chat_handler pulls in the
+    # rest of the assistant stack and is only needed for standalone runs
+    from assistant_controller.chat_handler import ChatHandler
+
+    pm = ProjectManager(profile="default")
+    context = ContextManager()
+    # Pass context to ChatHandler for better state coordination
+    chat_handler = ChatHandler(
+        context_manager=context,
+        get_project_path=pm.get_current_project
+    )
+
+    # Get plugin dict, must be dict not Gradio UI container
+    plugins = await get_canvas_plugins_ui(context)
+    if not isinstance(plugins, dict):
+        logger.warning("Expected plugins dict but got %s; attempting to continue", type(plugins))
+
+    demo = await async_canvas_ui(pm, chat_handler, context, plugins)
+
+    # Launch Gradio from the already-running loop: no loop teardown/recreate
+    # between UI build and serve, and the browser opener is just a timer
+    # callback on the same loop
+    demo.queue()
+    await asyncio.to_thread(
+        demo.launch,
+        server_port=7861,
+        inbrowser=False,
+        prevent_thread_lock=True,
+        share=False,
+        quiet=False,
+    )
+    loop = asyncio.get_running_loop()
+    loop.call_later(3, webbrowser.open_new_tab, "http://127.0.0.1:7861")
+
+    # Keep the loop alive alongside Gradio's server
+    await asyncio.Event().wait()
+
+
+def main():
+    import sys
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    asyncio.run(main_async())
+
+
+# ─────────────────────────────────────────────
+# Exportable render() for external caller
+# ─────────────────────────────────────────────
+async def render(pm, chat_handler, context, plugins, *args, **kwargs):
+    return await async_canvas_ui(pm, chat_handler, context, plugins)
+
+
+if __name__ == "__main__":
+    main()
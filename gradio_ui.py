@@ -1,12 +1,18 @@
 import gradio as gr
 import os
+import time
 import asyncio
 from ai_memory.codecanvas.context_manager import ContextManager
+from ai_memory.codecanvas.ui_script_loader import cache_coroutine
 from assistant_controller.project_manager import ProjectManager
 
 # Shared context (singleton)
 default_context = ContextManager()
 
+def _combined_ui_cache_key(pm=None, chat_handler=None, context=None):
+    return (context, pm), None
+
+@cache_coroutine(_combined_ui_cache_key)
 async def create_combined_ui(pm=None, chat_handler=None, context=None):
     ctx = context or default_context
     pm = pm or ProjectManager()
@@ -49,24 +55,42 @@ async def create_combined_ui(pm=None, chat_handler=None, context=None):
 
             async def chatbot_submit(user_message, chat_history):
                 ctx.set_active_tabs(["Assistant UI"])
-                response = await chat_handler.process_input(user_message)
                 chat_history = chat_history or []
                 chat_history.append({"role": "user", "content": user_message})
-                chat_history.append({"role": "assistant", "content": response})
-                return chat_history, chat_history, ""
+                chat_history.append({"role": "assistant", "content": ""})
+
+                stream = getattr(chat_handler, "stream", None)
+                if stream is None:
+                    # Non-streaming handler: single final update
+                    chat_history[-1]["content"] = await chat_handler.process_input(user_message)
+                    yield chat_history, chat_history, ""
+                    return
+
+                # Streaming handler: accumulate chunks but rerender the
+                # chatbot at most every 50 ms to avoid UI-update thrash
+                last_yield = 0.0
+                async for chunk in stream(user_message):
+                    chat_history[-1]["content"] += chunk
+                    now = time.monotonic()
+                    if now - last_yield > 0.05:
+                        last_yield = now
+                        yield chat_history, chat_history, ""
+
+                # Always flush the final state
+                yield chat_history, chat_history, ""
 
             msg.submit(chatbot_submit, inputs=[msg, chatbot], outputs=[chatbot, chatbot, error_box])
 
         with gr.Tab("Code Canvas"):
-            # Await async_canvas_ui with loaded plugins
-            from ai_memory.codecanvas.canvas_ui import async_canvas_ui
+            from ai_memory.codecanvas.canvas_ui import _track_task
 
             # Because we're inside sync context manager, we can't await directly here.
             # So we'll use asyncio.create_task and a placeholder container.
             canvas_ui_container = gr.Column()
-            
-            # Schedule the async loading and UI population task
-            asyncio.create_task(
+
+            # Schedule the async loading and UI population task; _track_task
+            # holds a reference and logs failures
+            _track_task(
                 populate_canvas_ui(canvas_ui_container, pm, chat_handler, ctx, plugins)
             )
 
@@ -84,37 +108,30 @@ async def populate_canvas_ui(container, pm, chat_handler, ctx, plugins):
 # Optional synchronous launcher helper for standalone runs
 def main():
     import sys
-    import threading
     import webbrowser
 
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-    async def _main_async():
+    async def _serve():
         pm = ProjectManager(profile="default")
         ctx = ContextManager()
         from assistant_controller.chat_handler import ChatHandler
         chat_handler = ChatHandler(context_manager=ctx, get_project_path=lambda: ctx.project_path)
 
-        ui = await create_combined_ui(pm, chat_handler, ctx)
-        return ui
-
-    demo = asyncio.run(_main_async())
-
-    def open_browser_later(url="http://127.0.0.1:7861", delay=3):
-        import time
-        time.sleep(delay)
-        webbrowser.open_new_tab(url)
-
-    threading.Thread(target=open_browser_later, daemon=True).start()
+        demo = await create_combined_ui(pm, chat_handler, ctx)
+        demo.launch(
+            server_port=7861,
+            inbrowser=False,
+            prevent_thread_lock=True,
+            share=False,
+            quiet=False,
+        )
+        # Open the browser from the loop instead of a dedicated OS thread
+        await asyncio.sleep(3)
+        webbrowser.open_new_tab("http://127.0.0.1:7861")
 
-    demo.launch(
-        server_port=7861,
-        inbrowser=False,
-        prevent_thread_lock=True,
-        share=False,
-        quiet=False,
-    )
+    asyncio.run(_serve())
 
 
 if __name__ == "__main__":
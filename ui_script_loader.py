@@ -1,266 +1,460 @@
-import os
-import re
-import importlib.util
-import logging
-import traceback
-import time
-import json
-import asyncio
-import gradio as gr
-
-from ai_memory.codecanvas.context_manager import ContextManager
-
-CANVAS_DIR = os.path.dirname(__file__)
-CACHE_FILE = os.path.join(CANVAS_DIR, ".plugin_cache.json")
-
-EXCLUDED_FILES = {
-    "__init__.py",
-    "canvas_ui.py",
-    "ui_core_logic.py",
-    "ui_script_loader.py",
-    "context_manager.py",
-    "tree_utils.py",  # Excluded files that are not plugins
-}
-
-logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(os.path.join(CANVAS_DIR, "plugin_loader.log")),
-        logging.StreamHandler()
-    ]
-)
-
-def extract_metadata(lines, key):
-    key_lower = f"# {key.lower()}:"
-    for line in lines:
-        if line.lower().startswith(key_lower):
-            return line.split(":", 1)[1].strip()
-    return ""
-
-def load_cache():
-    try:
-        if os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-    except Exception as e:
-        logger.warning(f"Failed to load plugin cache: {e}")
-    return {}
-
-def save_cache(cache):
-    try:
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(cache, f, indent=2)
-    except Exception as e:
-        logger.warning(f"Failed to save plugin cache: {e}")
-
-def is_plugin_file(filename):
-    return (
-        filename.endswith(".py") 
-        and filename not in EXCLUDED_FILES 
-        and not filename.startswith("__")
-    )
-
-def find_plugin_files(root_dir, recursive=True):
-    files = []
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-        for file in filenames:
-            if is_plugin_file(file):
-                files.append(os.path.join(dirpath, file))
-        if not recursive:
-            break
-    return files
-
-async def maybe_await(obj):
-    if asyncio.iscoroutine(obj):
-        return await obj
-    return obj
-
-async def resolve_plugin_ui(ui_candidate):
-    if asyncio.iscoroutine(ui_candidate):
-        return await ui_candidate
-
-    if isinstance(ui_candidate, (gr.Blocks, gr.Tabs)):
-        logger.info("UI is already a Gradio container instance")
-        return ui_candidate
-
-    if callable(ui_candidate):
-        if asyncio.iscoroutinefunction(ui_candidate):
-            result = await ui_candidate()
-        else:
-            result = ui_candidate()
-
-        if isinstance(result, (gr.Blocks, gr.Tabs)):
-            logger.info("UI function returned a Gradio container")
-            return result
-
-        logger.info("UI function returned a component")
-        return result
-
-    logger.warning("UI value was neither callable nor a known container")
-    return ui_candidate
-
-async def load_plugin_module(path):
-    try:
-        spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        return mod
-    except Exception as e:
-        logger.error(f"Failed to import plugin module {path}: {e}\n{traceback.format_exc()}")
-        return None
-
-async def initialize_plugin(mod, context, path, title):
-    start_time = time.time()
-    version = getattr(mod, "__version__", None)
-    requires = getattr(mod, "__requires__", None)
-
-    if requires:
-        logger.info(f"Plugin '{title}' requires: {requires}")
-
-    try:
-        if hasattr(mod, "register_plugin"):
-            plugin_obj = await maybe_await(mod.register_plugin(context))
-            logger.info(f"Registered plugin '{title}' version {version or 'unknown'} from {path}")
-        else:
-            logger.warning(f"Plugin '{title}' missing 'register_plugin(context)' function")
-            return None
-
-        if hasattr(mod, "register_hooks"):
-            await maybe_await(mod.register_hooks(context))
-            logger.info(f"Registered hooks for plugin '{title}'")
-
-        if not isinstance(plugin_obj, dict) or "ui" not in plugin_obj:
-            logger.warning(f"Plugin '{title}' did not return valid plugin dict with 'ui' key")
-            return None
-
-        plugin_ui = await resolve_plugin_ui(plugin_obj["ui"])
-
-        elapsed = time.time() - start_time
-        logger.info(f"Plugin '{title}' initialized in {elapsed:.2f}s")
-
-        return {
-            "title": title,
-            "description": extract_metadata(open(path, encoding='utf-8').readlines(), "description"),
-            "ui": plugin_ui,
-            "version": version,
-            "path": path,
-            "plugin_obj": plugin_obj
-        }
-
-    except Exception as e:
-        logger.error(f"Error initializing plugin '{title}': {e}\n{traceback.format_exc()}")
-        return None
-
-async def get_canvas_plugins(context=None, recursive=True, use_cache=True):
-    if context is None:
-        context = ContextManager()
-    plugins = {}
-
-    plugin_files = find_plugin_files(CANVAS_DIR, recursive=recursive)
-    logger.info(f"Found {len(plugin_files)} plugin files")
-
-    cache = load_cache() if use_cache else {}
-
-    for path in plugin_files:
-        mtime = os.path.getmtime(path)
-        cache_entry = cache.get(path)
-        if use_cache and cache_entry and cache_entry.get("mtime") == mtime:
-            logger.info(f"Loading plugin metadata from cache: {path}")
-            mod = await load_plugin_module(path)
-            if not mod:
-                continue
-            plugin_obj = await maybe_await(mod.register_plugin(context))
-            plugin_ui = await resolve_plugin_ui(plugin_obj.get("ui"))
-
-            plugins[cache_entry["title"]] = {
-                **cache_entry,
-                "plugin_obj": plugin_obj,
-                "ui": plugin_ui,
-                "path": path
-            }
-            continue
-
-        try:
-            with open(path, encoding="utf-8") as f:
-                lines = f.readlines()
-            title = extract_metadata(lines, "title") or os.path.basename(path)
-            mod = await load_plugin_module(path)
-            if not mod:
-                continue
-            plugin_data = await initialize_plugin(mod, context, path, title)
-            if plugin_data:
-                plugins[plugin_data["title"]] = plugin_data
-                cache[path] = {
-                    "title": plugin_data["title"],
-                    "description": plugin_data["description"],
-                    "mtime": mtime,
-                    "version": plugin_data["version"]
-                }
-        except Exception as e:
-            logger.error(f"Failed loading plugin {path}: {e}\n{traceback.format_exc()}")
-
-    if use_cache:
-        save_cache(cache)
-
-    context.plugins = plugins
-    return plugins, context
-
-async def load_scripts(context):
-    logger.info("Running async load_scripts() for one-time plugin runners")
-    scripts_executed = []
-
-    for title, plugin in context.plugins.items():
-        plugin_obj = plugin.get("plugin_obj")
-        if plugin_obj and hasattr(plugin_obj, "run"):
-            try:
-                result = await maybe_await(plugin_obj.run())
-                scripts_executed.append((title, "success", result))
-                logger.info(f"Executed plugin.run() for {title}")
-            except Exception as e:
-                scripts_executed.append((title, "error", str(e)))
-                logger.error(f"Error executing plugin.run() for {title}: {e}\n{traceback.format_exc()}")
-
-    return scripts_executed
-
-def prepare_plugins():
-    print("[patcher] Skipped patching; manual fixes required.")
-
-async def get_canvas_plugins_ui(context=None):
-    if context is None:
-        context = ContextManager()
-
-    plugins, context = await get_canvas_plugins(context=context)
-    await load_scripts(context)
-
-    with gr.Tabs() as plugins_ui:
-        if not plugins:
-            with gr.TabItem("No Plugins"):
-                gr.Markdown("No plugins loaded or available.")
-        else:
-            for title, plugin_data in plugins.items():
-                description = plugin_data.get("description", "(No description)")
-                plugin_ui = plugin_data.get("ui")
-
-                with gr.TabItem(title):
-                    gr.Markdown(description)
-                    if plugin_ui:
-                        try:
-                            # Do NOT call render(), just add component
-                            if isinstance(plugin_ui, (gr.Blocks, gr.Tabs)):
-                                # Already a container, just add it
-                                plugin_ui
-                            elif callable(plugin_ui):
-                                plugin_ui()
-                            else:
-                                # If UI is a single component
-                                pass
-                        except Exception as e:
-                            gr.Markdown(f"\u26a0\ufe0f Failed to render UI: {e}")
-
-    return plugins_ui
-
-if __name__ == "__main__":
-    prepare_plugins()
+import os
+import importlib.util
+import logging
+import traceback
+import time
+import pickle
+import asyncio
+import functools
+import weakref
+import concurrent.futures
+import gradio as gr
+
+from ai_memory.codecanvas.context_manager import ContextManager
+
+CANVAS_DIR = os.path.dirname(__file__)
+CACHE_FILE = os.path.join(CANVAS_DIR, ".plugin_cache.pkl")
+
+EXCLUDED_FILES = frozenset({
+    "__init__.py",
+    "canvas_ui.py",
+    "ui_core_logic.py",
+    "ui_script_loader.py",
+    "context_manager.py",
+    "tree_utils.py",  # Excluded files that are not plugins
+})
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    handlers=[
+        logging.FileHandler(os.path.join(CANVAS_DIR, "plugin_loader.log")),
+        logging.StreamHandler()
+    ]
+)
+
+def _read_header(path, max_bytes=4096):
+    """Read the leading block of a plugin file and pull out every
+    '# key: value' comment into a dict (title, description, ...)."""
+    headers = {}
+    try:
+        with open(path, "rb") as f:
+            block = f.read(max_bytes)
+        for line in block.decode("utf-8", errors="replace").splitlines():
+            line = line.strip()
+            if not line.startswith("#") or ":" not in line:
+                continue
+            key, _, value = line.lstrip("#").partition(":")
+            headers[key.strip().lower()] = value.strip()
+    except OSError as e:
+        logger.warning("Failed to read plugin header %s: %s", path, e)
+    return headers
+
+def load_cache():
+    try:
+        if os.path.exists(CACHE_FILE):
+            with open(CACHE_FILE, "rb") as f:
+                return pickle.load(f)
+    except Exception as e:
+        logger.warning("Failed to load plugin cache: %s", e)
+    return {}
+
+def save_cache(cache):
+    try:
+        with open(CACHE_FILE, "wb") as f:
+            pickle.dump(cache, f, protocol=5)
+    except Exception as e:
+        logger.warning("Failed to save plugin cache: %s", e)
+
+def is_plugin_file(filename, _excluded=EXCLUDED_FILES.__contains__, _dunder=("__",)):
+    # Defaults bind the membership test and prefix tuple once so the
+    # directory-scan hot loop avoids repeated global lookups
+    return (
+        filename.endswith(".py")
+        and not filename.startswith(_dunder)
+        and not _excluded(filename)
+    )
+
+def find_plugin_files(root_dir, recursive=True):
+    """Yield (path, mtime, size) per plugin candidate, reusing the stat
+    result DirEntry already holds instead of a second getmtime call."""
+    try:
+        entries = os.scandir(root_dir)
+    except OSError as e:
+        logger.warning("Failed to scan plugin dir %s: %s", root_dir, e)
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and not entry.name.startswith("."):
+                    yield from find_plugin_files(entry.path, recursive=recursive)
+            elif is_plugin_file(entry.name):
+                st = entry.stat()
+                yield entry.path, st.st_mtime, st.st_size
+
+# Memoized coroutine calls: base key -> (signature, future, anchors)
+_coroutine_futures = {}
+
+def cache_coroutine(key_fn):
+    """Memoize a coroutine function by sharing one Future per call key, so
+    concurrent and repeat callers reuse the in-flight/finished result
+    instead of re-running the coroutine.
+
+    key_fn returns (anchors, signature): anchors are the objects whose
+    identity scopes the memo (held alongside the future so their ids
+    can't be recycled onto stale entries), and signature is compared on
+    every call — a changed signature replaces the old future in place
+    rather than stranding it, so the memo stays bounded at one entry per
+    (function, anchors)."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            anchors, signature = key_fn(*args, **kwargs)
+            key = (fn.__qualname__,) + tuple(id(anchor) for anchor in anchors)
+            entry = _coroutine_futures.get(key)
+            if entry is not None:
+                old_signature, future, _ = entry
+                if (old_signature == signature
+                        and not future.cancelled()
+                        and not (future.done() and future.exception() is not None)):
+                    return future
+            future = asyncio.ensure_future(fn(*args, **kwargs))
+            _coroutine_futures[key] = (signature, future, anchors)
+            return future
+        return wrapper
+    return decorator
+
+def _plugin_tree_signature():
+    return tuple(find_plugin_files(CANVAS_DIR))
+
+def _plugins_cache_key(context=None, recursive=True, use_cache=True):
+    return (context,), (recursive, use_cache, _plugin_tree_signature())
+
+async def maybe_await(obj):
+    if asyncio.iscoroutine(obj):
+        return await obj
+    return obj
+
+# Already-resolved UI objects by identity, so hot-reload/remount cycles
+# skip the isinstance/callable chains below
+_resolved_ui = weakref.WeakValueDictionary()
+
+def _remember_resolved(ui):
+    try:
+        _resolved_ui[id(ui)] = ui
+    except TypeError:
+        pass  # not weak-referenceable; skip caching
+    return ui
+
+async def resolve_plugin_ui(ui_candidate):
+    if asyncio.iscoroutine(ui_candidate):
+        return await ui_candidate
+
+    cached = _resolved_ui.get(id(ui_candidate))
+    if cached is not None:
+        return cached
+
+    if isinstance(ui_candidate, (gr.Blocks, gr.Tabs)):
+        logger.info("UI is already a Gradio container instance")
+        return _remember_resolved(ui_candidate)
+
+    if callable(ui_candidate):
+        if asyncio.iscoroutinefunction(ui_candidate):
+            result = await ui_candidate()
+        else:
+            result = ui_candidate()
+            if asyncio.iscoroutine(result):
+                result = await result
+
+        if isinstance(result, (gr.Blocks, gr.Tabs)):
+            logger.info("UI function returned a Gradio container")
+            return result
+
+        logger.info("UI function returned a component")
+        return result
+
+    logger.warning("UI value was neither callable nor a known container")
+    return _remember_resolved(ui_candidate)
+
+# Shared pool for blocking plugin imports so the event loop stays free
+_IMPORT_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4)
+)
+
+def _sync_load(path):
+    spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+async def load_plugin_module(path):
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_IMPORT_POOL, _sync_load, path)
+    except Exception as e:
+        logger.error("Failed to import plugin module %s: %s\n%s", path, e, traceback.format_exc())
+        return None
+
+class _LazyUI:
+    """Deferred UI for cache hits: the plugin module is imported and
+    register_plugin runs on first call (tab hydration), so a warm start
+    is a pure cache read. The cold-path side effects (register_hooks,
+    the one-time plugin.run() that load_scripts would have executed)
+    run here too, and the registered plugin_obj is written back into
+    the plugins entry."""
+
+    def __init__(self, path, title, context, entry=None):
+        self.path = path
+        self.title = title
+        self.context = context
+        self.entry = entry
+        self._resolved = None
+        self._done = False
+        self._future = None
+
+    async def __call__(self):
+        if self._done:
+            return self._resolved
+        # Overlapping hydrations share one in-flight execution so
+        # register_plugin/register_hooks/run() happen exactly once; a
+        # cancelled or failed execution is replaced on the next call
+        if (self._future is None or self._future.cancelled()
+                or (self._future.done() and self._future.exception() is not None)):
+            self._future = asyncio.ensure_future(self._load())
+        return await self._future
+
+    async def _load(self):
+        mod = await load_plugin_module(self.path)
+        if mod is None:
+            self._future = None  # allow a later hydration to retry
+            return None
+        plugin_obj = await maybe_await(mod.register_plugin(self.context))
+
+        if hasattr(mod, "register_hooks"):
+            await maybe_await(mod.register_hooks(self.context))
+            logger.info("Registered hooks for plugin '%s'", self.title)
+
+        if self.entry is not None:
+            self.entry["plugin_obj"] = plugin_obj
+
+        # Deferred one-time startup hook that load_scripts skipped because
+        # plugin_obj wasn't available at discovery time
+        if getattr(plugin_obj, "run", None):
+            try:
+                await asyncio.wait_for(
+                    maybe_await(plugin_obj.run()), timeout=RUN_TIMEOUT_S
+                )
+                logger.info("Executed deferred plugin.run() for %s", self.title)
+            except Exception as e:
+                logger.error("Error executing deferred plugin.run() for %s: %s\n%s",
+                             self.title, e, traceback.format_exc())
+
+        ui = None
+        if isinstance(plugin_obj, dict):
+            ui = await resolve_plugin_ui(plugin_obj.get("ui"))
+        self._resolved = ui
+        self._done = True
+        return ui
+
+async def initialize_plugin(mod, context, path, title, headers=None):
+    start_time = time.time()
+    version = getattr(mod, "__version__", None)
+    requires = getattr(mod, "__requires__", None)
+
+    if requires:
+        logger.info("Plugin '%s' requires: %s", title, requires)
+
+    try:
+        if hasattr(mod, "register_plugin"):
+            plugin_obj = await maybe_await(mod.register_plugin(context))
+            logger.info("Registered plugin '%s' version %s from %s", title, version or "unknown", path)
+        else:
+            logger.warning("Plugin '%s' missing 'register_plugin(context)' function", title)
+            return None
+
+        if hasattr(mod, "register_hooks"):
+            await maybe_await(mod.register_hooks(context))
+            logger.info("Registered hooks for plugin '%s'", title)
+
+        if not isinstance(plugin_obj, dict) or "ui" not in plugin_obj:
+            logger.warning("Plugin '%s' did not return valid plugin dict with 'ui' key", title)
+            return None
+
+        plugin_ui = await resolve_plugin_ui(plugin_obj["ui"])
+
+        elapsed = time.time() - start_time
+        logger.info("Plugin '%s' initialized in %.2fs", title, elapsed)
+
+        if headers is None:
+            headers = _read_header(path)
+
+        return {
+            "title": title,
+            "description": headers.get("description", ""),
+            "ui": plugin_ui,
+            "version": version,
+            "path": path,
+            "plugin_obj": plugin_obj
+        }
+
+    except Exception as e:
+        logger.error("Error initializing plugin '%s': %s\n%s", title, e, traceback.format_exc())
+        return None
+
+@cache_coroutine(_plugins_cache_key)
+async def get_canvas_plugins(context=None, recursive=True, use_cache=True):
+    if context is None:
+        context = ContextManager()
+    plugins = {}
+
+    plugin_files = list(find_plugin_files(CANVAS_DIR, recursive=recursive))
+    logger.info("Found %d plugin files", len(plugin_files))
+
+    cache = load_cache() if use_cache else {}
+
+    async def _process_one(path, mtime, size):
+        try:
+            cache_entry = cache.get(path)
+            if (use_cache and cache_entry
+                    and cache_entry.get("mtime") == mtime
+                    and cache_entry.get("size") == size):
+                logger.info("Loading plugin metadata from cache: %s", path)
+                # Cache is authoritative for metadata; import + register_plugin
+                # are deferred until the tab is actually hydrated, at which
+                # point _LazyUI fills plugin_obj back in
+                entry = {
+                    **cache_entry,
+                    "plugin_obj": None,
+                    "path": path
+                }
+                entry["ui"] = _LazyUI(path, cache_entry["title"], context, entry)
+                plugins[cache_entry["title"]] = entry
+                return
+
+            headers = _read_header(path)
+            title = headers.get("title") or os.path.basename(path)
+            mod = await load_plugin_module(path)
+            if not mod:
+                return
+            plugin_data = await initialize_plugin(mod, context, path, title, headers)
+            if plugin_data:
+                plugins[plugin_data["title"]] = plugin_data
+                cache[path] = {
+                    "title": plugin_data["title"],
+                    "description": plugin_data["description"],
+                    "mtime": mtime,
+                    "size": size,
+                    "version": plugin_data["version"],
+                    "headers": headers
+                }
+        except Exception as e:
+            logger.error("Failed loading plugin %s: %s\n%s", path, e, traceback.format_exc())
+
+    # Fan out all plugin loads so total wall time is bounded by the slowest
+    # import instead of the sum of them
+    tasks = [asyncio.create_task(_process_one(*entry)) for entry in plugin_files]
+    if tasks:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for (path, _mtime, _size), result in zip(plugin_files, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed loading plugin %s: %s", path, result)
+
+    if use_cache:
+        save_cache(cache)
+
+    context.plugins = plugins
+    return plugins, context
+
+# Upper bound on a single plugin.run() so one misbehaving plugin can't
+# stall canvas launch
+RUN_TIMEOUT_S = 30
+
+async def load_scripts(context):
+    logger.info("Running async load_scripts() for one-time plugin runners")
+
+    async def _run_one(title, plugin_obj):
+        try:
+            result = await asyncio.wait_for(
+                maybe_await(plugin_obj.run()), timeout=RUN_TIMEOUT_S
+            )
+            logger.info("Executed plugin.run() for %s", title)
+            return (title, "success", result)
+        except Exception as e:
+            logger.error("Error executing plugin.run() for %s: %s\n%s", title, e, traceback.format_exc())
+            return (title, "error", str(e))
+
+    coros = [
+        _run_one(title, plugin.get("plugin_obj"))
+        for title, plugin in context.plugins.items()
+        if getattr(plugin.get("plugin_obj"), "run", None)
+    ]
+    if not coros:
+        return []
+    return list(await asyncio.gather(*coros))
+
+def prepare_plugins():
+    print("[patcher] Skipped patching; manual fixes required.")
+
+async def get_canvas_plugins_ui(context=None):
+    if context is None:
+        context = ContextManager()
+
+    plugins, context = await get_canvas_plugins(context=context)
+    await load_scripts(context)
+
+    with gr.Tabs() as plugins_ui:
+        if not plugins:
+            with gr.TabItem("No Plugins"):
+                gr.Markdown("No plugins loaded or available.")
+        else:
+            # Progressive hydration: build only cheap tab shells up front and
+            # resolve each plugin UI the first time its tab is selected, so
+            # first paint doesn't wait on the slowest plugin.
+            containers = {}
+            hydrated = set()
+
+            for title, plugin_data in plugins.items():
+                description = plugin_data.get("description", "(No description)")
+
+                with gr.TabItem(title):
+                    gr.Markdown(description)
+                    with gr.Column() as placeholder:
+                        gr.Markdown("Loading plugin UI...")
+                    containers[title] = placeholder
+
+            async def _hydrate(title):
+                if title in hydrated or title not in containers:
+                    return
+                container = containers[title]
+                try:
+                    plugin_ui = await resolve_plugin_ui(plugins[title].get("ui"))
+                    container.clear()
+                    if plugin_ui is not None:
+                        # Insert without calling render(), as populate_assistant_ui does
+                        container.append(plugin_ui)
+                    # Mark done only on success so a failed tab retries on reselect
+                    hydrated.add(title)
+                except Exception as e:
+                    logger.error("Failed to hydrate plugin tab '%s': %s\n%s", title, e, traceback.format_exc())
+                    container.clear()
+                    container.append(gr.Markdown(f"⚠️ Failed to render UI: {e}"))
+
+            async def _hydrate_tab(evt: gr.SelectData):
+                await _hydrate(evt.value)
+
+            if gr.context.Context.root_block is not None:
+                plugins_ui.select(_hydrate_tab)
+                # Tabs.select only fires on user switches, so the
+                # default-selected first tab must be hydrated eagerly
+                await _hydrate(next(iter(plugins)))
+            else:
+                # No enclosing Blocks, so select can't be wired (Gradio
+                # raises outside a Blocks context); hydrate everything now
+                for title in plugins:
+                    await _hydrate(title)
+
+    return plugins_ui
+
+if __name__ == "__main__":
+    prepare_plugins()